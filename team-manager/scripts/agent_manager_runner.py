@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Run agent-manager's `start` and then `assign` in one python3 process.
+
+Usage: agent_manager_runner.py AGENT_MANAGER_MAIN LEAD_ID [--working-dir DIR]
+
+The task is read from stdin and handed to `assign` as its stdin. Each step
+runs agent-manager's main.py as __main__ (as `python3 main.py ...` would)
+with fds 0-2 pointed at temp files, so output from the script and from any
+child processes it spawns is captured per step. A single JSON object is
+written to stdout:
+
+    {"start": [returncode, stdout, stderr], "assign": [...] or null}
+
+`assign` is skipped (null) when `start` fails.
+"""
+
+import json
+import os
+import runpy
+import sys
+import tempfile
+import traceback
+
+
+def _run_step(script, argv, stdin_bytes):
+    """Run SCRIPT as __main__ with ARGV; return [returncode, stdout, stderr]."""
+    saved_fds = [os.dup(fd) for fd in (0, 1, 2)]
+    saved_argv = sys.argv
+    files = [tempfile.TemporaryFile() for _ in range(3)]
+    try:
+        files[0].write(stdin_bytes)
+        files[0].seek(0)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        for fd, f in enumerate(files):
+            os.dup2(f.fileno(), fd)
+
+        sys.argv = [script, *argv]
+        returncode = 0
+        try:
+            runpy.run_path(script, run_name='__main__')
+        except SystemExit as e:
+            if e.code is None or isinstance(e.code, int):
+                returncode = e.code or 0
+            else:
+                print(e.code, file=sys.stderr)
+                returncode = 1
+        except BaseException:
+            traceback.print_exc()
+            returncode = 1
+        sys.stdout.flush()
+        sys.stderr.flush()
+    finally:
+        sys.argv = saved_argv
+        for fd, saved in enumerate(saved_fds):
+            os.dup2(saved, fd)
+            os.close(saved)
+
+    outputs = []
+    for f in files[1:]:
+        f.seek(0)
+        outputs.append(f.read().decode('utf-8', 'replace'))
+    for f in files:
+        f.close()
+    return [returncode, *outputs]
+
+
+def main():
+    script, lead_id = sys.argv[1], sys.argv[2]
+    start_args = ['start', lead_id, *sys.argv[3:]]
+    task = sys.stdin.buffer.read()
+
+    # Resolve agent-manager's imports against its own scripts dir, not ours.
+    sys.path[0] = os.path.dirname(os.path.abspath(script))
+
+    result = {'start': _run_step(script, start_args, b''), 'assign': None}
+    if result['start'][0] == 0:
+        result['assign'] = _run_step(script, ['assign', lead_id], task)
+
+    sys.stdout.write(json.dumps(result))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
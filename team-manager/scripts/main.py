@@ -8,14 +8,20 @@ Workflow is defined in the team configuration body using mermaid diagrams.
 """
 
 import argparse
+import functools
 import sys
 import os
-import subprocess
+import re
+import stat
+import textwrap
 from pathlib import Path
-from datetime import datetime, timezone
+
+# abspath rather than resolve(): we only need an absolute path for hints and
+# sys.path, not symlink resolution (which stats every path component).
+_SCRIPT_PATH = Path(os.path.abspath(__file__))
 
 # Add scripts directory to path
-sys.path.insert(0, str(Path(__file__).parent))
+sys.path.insert(0, str(_SCRIPT_PATH.parent))
 
 from repo_root import get_repo_root, find_agent_manager_scripts_dir, get_skill_search_dirs
 
@@ -25,23 +31,42 @@ from repo_root import get_repo_root, find_agent_manager_scripts_dir, get_skill_s
 _REPO_ROOT = get_repo_root()
 os.environ.setdefault('REPO_ROOT', str(_REPO_ROOT))
 _AGENTS_DIR = _REPO_ROOT / 'agents'
+_STATE_DIR = _REPO_ROOT / '.claude' / 'state' / 'team-assignments'
+_state_dirs_created = set()
 
 _AGENT_MANAGER_SCRIPTS_DIR = find_agent_manager_scripts_dir(_REPO_ROOT)
 if _AGENT_MANAGER_SCRIPTS_DIR:
     sys.path.insert(0, str(_AGENT_MANAGER_SCRIPTS_DIR))
 
 
+# SKILL.md path -> (st_mtime_ns, content); re-read only when the file changes.
+_skill_cache = {}
+
+
 def _read_skill_md(skill_name: str, repo_root: Path) -> str:
     for root in get_skill_search_dirs(repo_root):
         candidate = root / skill_name / 'SKILL.md'
-        if candidate.exists() and candidate.is_file():
-            return candidate.read_text(encoding='utf-8')
+        try:
+            st = candidate.stat()
+        except OSError:
+            continue
+        if not stat.S_ISREG(st.st_mode):
+            continue
+
+        key = str(candidate)
+        cached = _skill_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        content = candidate.read_text(encoding='utf-8')
+        _skill_cache[key] = (st.st_mtime_ns, content)
+        return content
     raise FileNotFoundError(f"Skill not found: {skill_name}")
 
 from team_config import (
     list_all_teams,
     resolve_team,
     get_team_members,
+    normalize_members,
     get_lead_agent_id,
     get_team_body,
     get_team_working_directory,
@@ -49,29 +74,82 @@ from team_config import (
     get_teams_dir,
 )
 
-# Import agent-manager helpers
-try:
-    from agent_config import resolve_agent
-except ImportError:
-    # Fallback if agent-manager is not available
-    def resolve_agent(name, agents_dir=None): return None
-
-try:
-    from tmux_helper import capture_output, send_keys, session_exists, get_agent_runtime_state
-except ImportError:
-    def capture_output(agent_id, lines=100):
-        return None
+@functools.lru_cache(maxsize=None)
+def _load_agent_manager():
+    """
+    Import agent-manager helpers on first use.
+
+    Only runs once a command needs an agent or tmux: --help, argument errors
+    and `list --json` (without --resolve-names) skip these imports entirely,
+    while create still loads them to resolve --members names.
+
+    Returns:
+        Dict of helper callables plus 'have_tmux_helper'.
+    """
+    helpers = {}
+
+    try:
+        from agent_config import resolve_agent as _resolve_agent
+    except ImportError:
+        # Fallback if agent-manager is not available
+        def _resolve_agent(name, agents_dir=None): return None
+    helpers['resolve_agent'] = _resolve_agent
+
+    try:
+        from tmux_helper import (
+            capture_output as _capture_output,
+            send_keys as _send_keys,
+            session_exists as _session_exists,
+            get_agent_runtime_state as _get_agent_runtime_state,
+        )
+        helpers['have_tmux_helper'] = True
+    except ImportError:
+        helpers['have_tmux_helper'] = False
+
+        def _capture_output(agent_id, lines=100):
+            return None
+
+        def _send_keys(agent_id, message, **kwargs):
+            _ = kwargs
+            return False
+
+        def _session_exists(agent_id):
+            return False
+
+        def _get_agent_runtime_state(agent_id, launcher=""):
+            _ = launcher
+            return {'state': 'unknown'}
 
-    def send_keys(agent_id, message, **kwargs):
-        _ = kwargs
-        return False
+    helpers['capture_output'] = _capture_output
+    helpers['send_keys'] = _send_keys
+    helpers['session_exists'] = _session_exists
+    helpers['get_agent_runtime_state'] = _get_agent_runtime_state
+    return helpers
 
-    def session_exists(agent_id):
-        return False
 
-    def get_agent_runtime_state(agent_id, launcher=""):
-        _ = launcher
-        return {'state': 'unknown'}
+def resolve_agent(name, agents_dir=None):
+    return _load_agent_manager()['resolve_agent'](name, agents_dir=agents_dir)
+
+
+def capture_output(agent_id, lines=100):
+    return _load_agent_manager()['capture_output'](agent_id, lines)
+
+
+def send_keys(agent_id, message, **kwargs):
+    return _load_agent_manager()['send_keys'](agent_id, message, **kwargs)
+
+
+def session_exists(agent_id):
+    return _load_agent_manager()['session_exists'](agent_id)
+
+
+def get_agent_runtime_state(agent_id, launcher=""):
+    return _load_agent_manager()['get_agent_runtime_state'](agent_id, launcher=launcher)
+
+
+_EMP_ID_RE = re.compile(r'EMP[_-]?\d+', re.IGNORECASE)
+_EMP_ID_TRANS = str.maketrans('_', '-')
+
 
 # get_agent_id is a simple function - define it locally to avoid circular import
 def get_agent_id(agent_config):
@@ -81,12 +159,68 @@ def get_agent_id(agent_config):
         name = agent_config.get('name', '')
         # Extract from name if it contains the ID
         # Common patterns: EMP_0001, emp-0001, etc.
-        import re
-        match = re.search(r'EMP[_-]?\d+', name, re.IGNORECASE)
+        match = _EMP_ID_RE.search(name)
         if match:
             file_id = match.group(0)
     # Convert EMP_0001 -> emp-0001
-    return file_id.lower().replace('_', '-') if file_id else file_id
+    return file_id.lower().translate(_EMP_ID_TRANS) if file_id else file_id
+
+
+def list_agent_sessions():
+    """
+    List running tmux session names with a single `tmux list-sessions` call.
+
+    Returns:
+        Set of session names, or None if tmux could not be queried (callers
+        should fall back to per-agent session_exists()).
+    """
+    if not _load_agent_manager()['have_tmux_helper']:
+        # Keep parity with the session_exists() fallback: nothing is running.
+        return set()
+
+    import subprocess
+
+    try:
+        result = subprocess.run(
+            ['tmux', 'list-sessions', '-F', '#{session_name}'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+        )
+    except Exception:
+        return None
+    if result.returncode != 0:
+        # tmux exits non-zero when no server is running.
+        return set()
+    return {line.strip() for line in result.stdout.splitlines() if line.strip()}
+
+
+def is_session_running(agent_id, sessions) -> bool:
+    """Check an agent's session against a list_agent_sessions() snapshot."""
+    if sessions is None:
+        return session_exists(agent_id)
+    return f"agent-{agent_id}" in sessions
+
+
+def _map_members(fn, members):
+    """
+    Apply fn to each member concurrently, returning results in member order.
+
+    Per-member work is dominated by agent config reads and tmux subprocesses,
+    so threads overlap the waits despite the GIL.
+    """
+    if len(members) <= 1:
+        return [fn(member) for member in members]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(8, len(members))) as executor:
+        return list(executor.map(fn, members))
+
+
+def _write_lines(lines) -> None:
+    """Write a block of output lines to stdout with a single write call."""
+    sys.stdout.write(''.join(f"{line}\n" for line in lines))
 
 
 def _format_duration(seconds: int) -> str:
@@ -97,18 +231,109 @@ def _format_duration(seconds: int) -> str:
     return f"{minutes}m{rem:02d}s"
 
 
+def _write_json_array(items, fp) -> None:
+    """
+    Stream an iterable as a JSON array, one element at a time.
+
+    Output matches json.dumps(list(items), indent=2) without materializing the list.
+    """
+    import json
+
+    first = True
+    for item in items:
+        fp.write('[\n' if first else ',\n')
+        fp.write(textwrap.indent(json.dumps(item, indent=2), '  '))
+        first = False
+    fp.write('[]\n' if first else '\n]\n')
+
+
+def _run_agent_manager(agent_manager: Path, argv, input_text=None) -> "subprocess.CompletedProcess":
+    """
+    Run an agent-manager CLI command as a separate python3 process.
+
+    Returns:
+        The captured subprocess.CompletedProcess.
+    """
+    import subprocess
+
+    return subprocess.run(
+        ['python3', str(agent_manager), *argv],
+        input=input_text,
+        capture_output=True,
+        text=True,
+    )
+
+
+def _start_and_assign(agent_manager: Path, lead_id: str, team_wd, task_message: str):
+    """
+    Run agent-manager `start` then `assign` in a single python3 process.
+
+    Uses agent_manager_runner.py so a cold lead costs one interpreter startup
+    instead of two.
+
+    Returns:
+        (start_result, assign_result) as CompletedProcess objects; assign_result
+        is None when start failed (assign is not attempted).
+    """
+    import json
+    import subprocess
+
+    cmd = ['python3', str(_SCRIPT_PATH.parent / 'agent_manager_runner.py'), str(agent_manager), lead_id]
+    if team_wd:
+        cmd.extend(['--working-dir', team_wd])
+    runner = subprocess.run(cmd, input=task_message, capture_output=True, text=True)
+
+    try:
+        steps = json.loads(runner.stdout)
+        start_result = subprocess.CompletedProcess(cmd, *steps['start'])
+        assign = steps['assign']
+    except (ValueError, KeyError, TypeError):
+        # The runner itself failed; report it as a failed start.
+        return subprocess.CompletedProcess(cmd, runner.returncode or 1, runner.stdout, runner.stderr), None
+
+    assign_result = subprocess.CompletedProcess(cmd, *assign) if assign is not None else None
+    return start_result, assign_result
+
+
 def persist_last_team_task(team_name: str, task: str) -> None:
     """Persist the last assigned task for a team for recovery/nudging."""
-    state_dir = _REPO_ROOT / '.claude' / 'state' / 'team-assignments'
-    state_dir.mkdir(parents=True, exist_ok=True)
+    if _STATE_DIR not in _state_dirs_created:
+        _STATE_DIR.mkdir(parents=True, exist_ok=True)
+        _state_dirs_created.add(_STATE_DIR)
+
+    import time
+
+    task_file = _STATE_DIR / f"{team_name}.md"
+    ts = time.gmtime()
+    timestamp = "%04d-%02d-%02d %02d:%02d:%02d UTC" % (
+        ts.tm_year, ts.tm_mon, ts.tm_mday, ts.tm_hour, ts.tm_min, ts.tm_sec,
+    )
+
+    # Gather-write header and task so a large task isn't copied into one buffer.
+    chunks = [
+        f"# Last team task: {team_name}\n\nUpdated: {timestamp}\n\n".encode('utf-8'),
+        task.strip().encode('utf-8'),
+        b'\n',
+    ]
+    fd = os.open(str(task_file), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        written = os.writev(fd, chunks) if hasattr(os, 'writev') else 0
+        if written < sum(len(chunk) for chunk in chunks):
+            # Short write (or no writev on this platform): finish with write().
+            rest = memoryview(b''.join(chunks))[written:]
+            while rest:
+                rest = rest[os.write(fd, rest):]
+    finally:
+        os.close(fd)
 
-    task_file = state_dir / f"{team_name}.md"
-    timestamp = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S UTC')
 
-    content = f"# Last team task: {team_name}\n\nUpdated: {timestamp}\n\n{task.strip()}\n"
-    task_file.write_text(content, encoding='utf-8')
+@functools.lru_cache(maxsize=512)
+def _resolve_agent_cached(employee_id: str):
+    """Resolve an agent config once per process (agents/ is re-parsed on every miss)."""
+    return resolve_agent(employee_id, agents_dir=_AGENTS_DIR)
 
 
+@functools.lru_cache(maxsize=512)
 def get_agent_name(employee_id: str) -> str:
     """
     Resolve employee ID to agent name.
@@ -119,78 +344,107 @@ def get_agent_name(employee_id: str) -> str:
     Returns:
         Agent name (e.g., 'dev') or employee_id if not found
     """
-    config = resolve_agent(employee_id, agents_dir=_AGENTS_DIR)
+    config = _resolve_agent_cached(employee_id)
     if config:
         return config.get('name', employee_id)
     return employee_id
 
 
+def _team_summary(team_name, config, name_cache):
+    """
+    Compute the per-team fields shared by the JSON and human list views.
+
+    Args:
+        name_cache: employee_id -> agent name, pre-populated by the caller.
+    """
+    lead_id = get_lead_agent_id(config)
+    members = get_team_members(config)
+
+    # Extract member employee IDs for easy access
+    member_ids = [m.get('employee_id') for m in members]
+
+    return {
+        'name': team_name,
+        'enabled': config.get('enabled', True),
+        'description': config.get('description', ''),
+        'lead_agent_id': lead_id,
+        'lead_agent_name': name_cache.get(lead_id) if lead_id else None,
+        'working_directory': get_team_working_directory(config),
+        'member_ids': member_ids,
+        'members': members,
+    }
+
+
+def _members_info(members):
+    """Expand (employee_id, role) pairs to (employee_id, agent_name, role)."""
+    return [(emp_id, get_agent_name(emp_id), role) for emp_id, role in members]
+
+
 def cmd_list(args):
     """List all teams."""
-    import json
     all_teams = list_all_teams()
 
+    # Resolve every lead name once, up front, before rendering either view.
+    # JSON consumers usually only need IDs, so names are opt-in there.
+    name_cache = {}
+    if not args.json or args.resolve_names:
+        for config in all_teams.values():
+            lead_id = get_lead_agent_id(config)
+            if lead_id and lead_id not in name_cache:
+                name_cache[lead_id] = get_agent_name(lead_id)
+
+    summaries = (
+        (config, _team_summary(team_name, config, name_cache))
+        for team_name, config in sorted(all_teams.items())
+    )
+
     # JSON output for programmatic consumption
     if args.json:
-        teams_data = []
-        for team_name, config in sorted(all_teams.items()):
-            lead_id = get_lead_agent_id(config)
-            members = get_team_members(config)
-
-            # Extract member employee IDs for easy access
-            member_ids = [m.get('employee_id') for m in members]
-
-            team_info = {
-                'name': team_name,
-                'enabled': config.get('enabled', True),
-                'description': config.get('description', ''),
-                'lead_agent_id': lead_id,
-                'lead_agent_name': get_agent_name(lead_id) if lead_id else None,
-                'working_directory': get_team_working_directory(config),
-                'member_ids': member_ids,
-                'members': members,
-            }
-            teams_data.append(team_info)
-
-        print(json.dumps(teams_data, indent=2))
+        _write_json_array((summary for _, summary in summaries), sys.stdout)
         return
 
-    # Human-readable output
-    print("📋 Teams:")
-    print()
+    # Human-readable output, buffered and written once
+    lines = []
+    out = lines.append
+    out("📋 Teams:")
+    out('')
 
     if not all_teams:
         teams_dir = get_teams_dir()
-        print(f"  No teams configured in {teams_dir}/")
-        print()
-        print("  Create a team by adding a TEAM_NAME.md file to teams/")
+        out(f"  No teams configured in {teams_dir}/")
+        out('')
+        out("  Create a team by adding a TEAM_NAME.md file to teams/")
+        _write_lines(lines)
         return
 
-    for team_name, config in sorted(all_teams.items()):
+    for config, summary in summaries:
+        team_name = summary['name']
+
         # Check if team is disabled
-        is_enabled = config.get('enabled', True)
-        status_icon = "" if is_enabled else "⛔ Disabled"
+        status_icon = "" if summary['enabled'] else "⛔ Disabled"
 
         if status_icon:
-            print(f"{status_icon} 📦 {team_name}")
+            out(f"{status_icon} 📦 {team_name}")
         else:
-            print(f"📦 {team_name}")
-        print(f"   Description: {config.get('description', 'No description')}")
+            out(f"📦 {team_name}")
+        out(f"   Description: {config.get('description', 'No description')}")
 
-        lead_id = get_lead_agent_id(config)
-        lead_name = get_agent_name(lead_id) if lead_id else "N/A"
-        print(f"   Lead Agent: {lead_id} ({lead_name})")
+        lead_id = summary['lead_agent_id']
+        lead_name = summary['lead_agent_name'] or "N/A"
+        out(f"   Lead Agent: {lead_id} ({lead_name})")
 
-        wd = get_team_working_directory(config)
+        wd = summary['working_directory']
         if wd:
-            print(f"   Working Dir: {wd}")
+            out(f"   Working Dir: {wd}")
 
-        members = get_team_members(config)
+        members = summary['members']
         if members:
             member_str = ', '.join([f"{m['employee_id']}({m.get('role', 'member')})" for m in members])
-            print(f"   Members: {member_str}")
+            out(f"   Members: {member_str}")
 
-        print()
+        out('')
+
+    _write_lines(lines)
 
 
 def cmd_show(args):
@@ -206,44 +460,45 @@ def cmd_show(args):
                 print(f"   - {name}")
         return 1
 
+    lines = []
+    out = lines.append
+
     # Validate config
     errors = validate_team_config(team)
     if errors:
-        print(f"⚠️  Team configuration has errors:")
+        out(f"⚠️  Team configuration has errors:")
         for error in errors:
-            print(f"   - {error}")
-        print()
+            out(f"   - {error}")
+        out('')
 
-    print(f"📦 Team: {team['name']}")
-    print(f"{'=' * 60}")
-    print(f"Description: {team.get('description', 'No description')}")
+    out(f"📦 Team: {team['name']}")
+    out(f"{'=' * 60}")
+    out(f"Description: {team.get('description', 'No description')}")
 
     lead_id = get_lead_agent_id(team)
     lead_name = get_agent_name(lead_id) if lead_id else "N/A"
-    print(f"Lead Agent: {lead_id} ({lead_name})")
-    print()
+    out(f"Lead Agent: {lead_id} ({lead_name})")
+    out('')
 
     # Members
-    members = get_team_members(team)
+    members = normalize_members(team)
     if members:
-        print("Members:")
-        for member in members:
-            emp_id = member.get('employee_id', 'unknown')
-            agent_name = get_agent_name(emp_id)
-            role = member.get('role', 'member')
+        out("Members:")
+        for emp_id, agent_name, role in _members_info(members):
             lead_mark = " 👑" if emp_id == lead_id else ""
-            print(f"  - {emp_id} ({agent_name}) - {role}{lead_mark}")
+            out(f"  - {emp_id} ({agent_name}) - {role}{lead_mark}")
     else:
-        print("No members defined")
+        out("No members defined")
 
     # Team body (workflow, documentation)
     body = get_team_body(team)
     if body:
-        print()
-        print("Team Documentation:")
-        print("-" * 60)
-        print(body)
+        out('')
+        out("Team Documentation:")
+        out("-" * 60)
+        out(body)
 
+    _write_lines(lines)
     return 0
 
 
@@ -263,20 +518,20 @@ def cmd_status(args):
         print(f"   To enable: Set 'enabled: true' in the team config")
         return 1
 
-    print(f"📊 Team Status: {team['name']}")
-    print(f"{'=' * 60}")
+    header = f"📊 Team Status: {team['name']}"
 
-    members = get_team_members(team)
+    members = normalize_members(team)
     lead_id = get_lead_agent_id(team)
+    sessions = list_agent_sessions()
 
-    for member in members:
-        emp_id = member.get('employee_id', 'unknown')
+    def probe(member):
+        """Build one member's status line (agent lookup + runtime state)."""
+        emp_id, role = member
         agent_name = get_agent_name(emp_id)
-        role = member.get('role', 'member')
         lead_mark = " 👑" if emp_id == lead_id else ""
 
         # Check if running and surface best-effort runtime state.
-        agent_config = resolve_agent(emp_id, agents_dir=_AGENTS_DIR)
+        agent_config = _resolve_agent_cached(emp_id)
         is_running = False
         runtime_state = None
 
@@ -284,19 +539,17 @@ def cmd_status(args):
             # Check if agent is disabled
             is_enabled = agent_config.get('enabled', True)
             if not is_enabled:
-                print(f"⛔ Disabled {emp_id} ({agent_name}) - {role}{lead_mark}")
-                continue
+                return f"⛔ Disabled {emp_id} ({agent_name}) - {role}{lead_mark}"
 
             agent_id = get_agent_id(agent_config)
-            is_running = session_exists(agent_id)
+            is_running = is_session_running(agent_id, sessions)
 
             if is_running:
                 launcher = agent_config.get('launcher', '')
                 runtime_state = get_agent_runtime_state(agent_id, launcher=launcher)
 
         if not is_running:
-            print(f"⭕ Stopped {emp_id} ({agent_name}) - {role}{lead_mark}")
-            continue
+            return f"⭕ Stopped {emp_id} ({agent_name}) - {role}{lead_mark}"
 
         state = (runtime_state or {}).get('state')
         elapsed_seconds = (runtime_state or {}).get('elapsed_seconds')
@@ -315,7 +568,11 @@ def cmd_status(args):
         elif state == "idle":
             suffix = " (idle)"
 
-        print(f"✅ Running{suffix} {emp_id} ({agent_name}) - {role}{lead_mark}")
+        return f"✅ Running{suffix} {emp_id} ({agent_name}) - {role}{lead_mark}"
+
+    lines = [header, '=' * 60]
+    lines.extend(_map_members(probe, members))
+    _write_lines(lines)
 
     return 0
 
@@ -364,38 +621,37 @@ def cmd_assign(args):
     if not lead_id:
         print("❌ Team has no lead_agent configured")
         return 1
+    lead_agent_config = _resolve_agent_cached(lead_id)
+    lead_name = get_agent_name(lead_id)
 
     # Get team working directory (overrides agent's working_directory)
     team_wd = get_team_working_directory(team)
 
     # Build task message with team context
-    members = get_team_members(team)
+    members = normalize_members(team)
     body = get_team_body(team)
 
-    task_message = f"""# Team Task Assignment
+    parts = [f"""# Team Task Assignment
 
 You are the **Lead Agent** for the **{team['name']}** team.
 
 ## Team Configuration
-- **Lead Agent**: {lead_id} ({get_agent_name(lead_id)})
+- **Lead Agent**: {lead_id} ({lead_name})
 - **Team Working Directory**: {team_wd or 'Use agent default'}
 - **Team Members**:
-"""
+"""]
 
-    for member in members:
-        emp_id = member.get('employee_id', 'unknown')
-        agent_name = get_agent_name(emp_id)
-        role = member.get('role', 'member')
+    for emp_id, agent_name, role in _members_info(members):
         lead_mark = " (lead)" if emp_id == lead_id else ""
-        task_message += f"  - {emp_id} ({agent_name}) - {role}{lead_mark}\n"
+        parts.append(f"  - {emp_id} ({agent_name}) - {role}{lead_mark}\n")
 
     # Include team body (workflow documentation)
     if body:
-        task_message += f"""
+        parts.append(f"""
 ## Team Workflow & Documentation
 
 {body}
-"""
+""")
 
     team_skills = team.get('skills', []) or []
     if team_skills:
@@ -417,11 +673,13 @@ You are the **Lead Agent** for the **{team['name']}** team.
             print(f"⚠️  Missing team skills: {', '.join(missing_skills)}")
 
         if loaded_skills:
-            task_message += "\n## Team Skills (Loaded for this task)\n\n"
-            task_message += "\n\n---\n\n".join(loaded_skills)
-            task_message += "\n"
+            parts.extend([
+                "\n## Team Skills (Loaded for this task)\n\n",
+                "\n\n---\n\n".join(loaded_skills),
+                "\n",
+            ])
 
-    task_message += f"""
+    parts.append(f"""
 
 ## Your Responsibilities
 1. Analyze the task requirements
@@ -455,11 +713,10 @@ You are the **Lead Agent** for the **{team['name']}** team.
 
 ---
 Please coordinate this task with your team and report back when complete.
-"""
+""")
+    task_message = ''.join(parts)
 
     # Use agent-manager to assign task to lead agent
-    import subprocess
-
     # Find agent-manager script (installed location; do not assume repo layout).
     agent_manager = None
     if _AGENT_MANAGER_SCRIPTS_DIR:
@@ -472,13 +729,12 @@ Please coordinate this task with your team and report back when complete.
         print(f"⚠️  agent-manager not found, attempting direct assignment...")
 
         # Try direct tmux send
-        agent_config = resolve_agent(lead_id, agents_dir=_AGENTS_DIR)
-        if agent_config:
-            agent_id = get_agent_id(agent_config)
+        if lead_agent_config:
+            agent_id = get_agent_id(lead_agent_config)
             if session_exists(agent_id):
                 send_keys(agent_id, task_message, send_enter=True)
                 print(f"✅ Task assigned to {team['name']} team")
-                print(f"   Lead Agent: {lead_id} ({get_agent_name(lead_id)})")
+                print(f"   Lead Agent: {lead_id} ({lead_name})")
                 print(f"   Monitor: tmux attach -t agent-{agent_id}")
                 return 0
             else:
@@ -499,32 +755,29 @@ Please coordinate this task with your team and report back when complete.
             return 1
 
     # Start lead agent with team working directory if not running
-    agent_config = resolve_agent(lead_id, agents_dir=_AGENTS_DIR)
-    if agent_config:
-        agent_session_id = get_agent_id(agent_config)
+    result = None
+    if lead_agent_config:
+        agent_session_id = get_agent_id(lead_agent_config)
         if session_exists(agent_session_id):
             # Lead agent is already running
             if args.restore:
                 # --restore (default): Continue with existing session
-                print(f"✅ Using existing session for lead agent '{lead_id}' ({get_agent_name(lead_id)})")
+                print(f"✅ Using existing session for lead agent '{lead_id}' ({lead_name})")
                 print()
             else:
                 # --no-restore: Fail if session exists
-                print(f"❌ Lead agent '{lead_id}' ({get_agent_name(lead_id)}) is already running")
+                print(f"❌ Lead agent '{lead_id}' ({lead_name}) is already running")
                 print(f"   Session: agent-{agent_session_id}")
                 print()
                 print(f"   To assign to the existing session, use --restore (default)")
-                print(f"   To stop first: python3 {Path(__file__).name} stop {team['name']}")
+                print(f"   To stop first: python3 {_SCRIPT_PATH.name} stop {team['name']}")
                 print(f"   Or: python3 ~/.claude/skills/agent-manager/scripts/main.py stop {lead_id}")
                 return 1
         else:
             # Agent not running, start it with team working directory
-            start_cmd = ['python3', str(agent_manager), 'start', lead_id]
-            if team_wd:
-                start_cmd.extend(['--working-dir', team_wd])
-
+            # and assign the task from the same process.
             print(f"⏳ Starting lead agent {lead_id}...")
-            start_result = subprocess.run(start_cmd, capture_output=True, text=True)
+            start_result, result = _start_and_assign(agent_manager, lead_id, team_wd, task_message)
             if start_result.returncode != 0:
                 print(f"❌ Failed to start lead agent: {start_result.stderr}")
                 return 1
@@ -532,27 +785,108 @@ Please coordinate this task with your team and report back when complete.
             print()
 
     # Use agent-manager CLI to assign task
-    result = subprocess.run(
-        ['python3', str(agent_manager), 'assign', lead_id],
-        input=task_message,
-        capture_output=True,
-        text=True
-    )
+    if result is None:
+        result = _run_agent_manager(agent_manager, ['assign', lead_id], input_text=task_message)
 
     if result.returncode == 0:
         print(f"✅ Task assigned to {team['name']} team")
-        print(f"   Lead Agent: {lead_id} ({get_agent_name(lead_id)})")
+        print(f"   Lead Agent: {lead_id} ({lead_name})")
         if team_wd:
             print(f"   Working Dir: {team_wd}")
         print()
         print("Monitor team progress:")
-        print(f"  python3 {Path(__file__).resolve()} monitor {team['name']}")
+        print(f"  python3 {_SCRIPT_PATH} monitor {team['name']}")
         return 0
     else:
         print(f"❌ Failed to assign task: {result.stderr}")
         return 1
 
 
+def _stream_team_output(watched, sessions) -> bool:
+    """
+    Stream running members' pane output through `tmux pipe-pane` into FIFOs.
+
+    Only new bytes are read, so no capture-pane subprocess runs per poll. Panes
+    that already have a pipe attached (e.g. agent-manager logging) are left alone.
+
+    Returns:
+        False if no pane could be piped (caller should poll instead); otherwise
+        streams until interrupted.
+    """
+    import codecs
+    import select
+    import shlex
+    import shutil
+    import subprocess
+    import tempfile
+
+    fifo_dir = tempfile.mkdtemp(prefix='team-manager-monitor-')
+    streams = {}  # read fd -> (emp_id, agent_name, session, keepalive write fd)
+    decoders = {}
+    try:
+        for emp_id, agent_name, agent_id in watched:
+            if not is_session_running(agent_id, sessions):
+                continue
+            session = f"agent-{agent_id}"
+
+            piped = subprocess.run(
+                ['tmux', 'display-message', '-p', '-t', session, '#{pane_pipe}'],
+                stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True,
+            )
+            if piped.returncode != 0 or piped.stdout.strip() != '0':
+                continue
+
+            fifo = os.path.join(fifo_dir, f"{agent_id}.fifo")
+            os.mkfifo(fifo)
+            read_fd = os.open(fifo, os.O_RDONLY | os.O_NONBLOCK)
+            write_fd = None
+            try:
+                # Hold a write end open so select() doesn't spin on EOF before tmux attaches.
+                write_fd = os.open(fifo, os.O_WRONLY | os.O_NONBLOCK)
+                result = subprocess.run(
+                    ['tmux', 'pipe-pane', '-o', '-t', session, f"cat >> {shlex.quote(fifo)}"],
+                    stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                )
+            except BaseException:
+                # Not in streams yet, so the cleanup below wouldn't see these fds.
+                os.close(read_fd)
+                if write_fd is not None:
+                    os.close(write_fd)
+                raise
+            if result.returncode != 0:
+                os.close(read_fd)
+                os.close(write_fd)
+                continue
+            streams[read_fd] = (emp_id, agent_name, session, write_fd)
+            # Per-pane decoder: a multibyte character may span two reads.
+            decoders[read_fd] = codecs.getincrementaldecoder('utf-8')('replace')
+
+        if not streams:
+            return False
+
+        last_fd = None
+        while True:
+            ready, _, _ = select.select(list(streams), [], [])
+            for fd in ready:
+                data = os.read(fd, 65536)
+                if not data:
+                    continue
+                emp_id, agent_name, _session, _write_fd = streams[fd]
+                if fd != last_fd:
+                    print(f"\n{'=' * 20} {emp_id} ({agent_name}) {'=' * 20}")
+                    last_fd = fd
+                sys.stdout.write(decoders[fd].decode(data))
+                sys.stdout.flush()
+    finally:
+        for fd, (_emp_id, _agent_name, session, write_fd) in streams.items():
+            # Close only the pipes we opened.
+            subprocess.run(['tmux', 'pipe-pane', '-t', session],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            os.close(fd)
+            os.close(write_fd)
+        shutil.rmtree(fifo_dir, ignore_errors=True)
+
+
 def cmd_monitor(args):
     """Monitor all team members' output."""
     team = resolve_team(args.team)
@@ -561,9 +895,10 @@ def cmd_monitor(args):
         print(f"❌ Team not found: {args.team}")
         return 1
 
-    members = get_team_members(team)
+    members = normalize_members(team)
 
     if args.follow:
+        import hashlib
         import time
 
         print(f"📺 Following {team['name']} team output (Ctrl+C to stop)...")
@@ -571,53 +906,83 @@ def cmd_monitor(args):
 
         last_outputs = {}
 
-        try:
-            while True:
-                for member in members:
-                    emp_id = member.get('employee_id', 'unknown')
+        # Resolve members once; agent configs don't change while following.
+        watched = []
+        for emp_id, _role in members:
+            agent_config = _resolve_agent_cached(emp_id)
+            if not agent_config:
+                continue
+            watched.append((emp_id, get_agent_name(emp_id), get_agent_id(agent_config)))
 
-                    agent_config = resolve_agent(emp_id, agents_dir=_AGENTS_DIR)
-                    if not agent_config:
-                        continue
+        if args.stream:
+            try:
+                if _stream_team_output(watched, list_agent_sessions()):
+                    return 0
+            except KeyboardInterrupt:
+                print("\n\n⏹  Monitoring stopped")
+                return 0
+            print("⚠️  tmux pipe-pane unavailable for this team, falling back to polling")
+            print()
+
+        # Poll faster while output is changing, back off while agents are quiet.
+        interval = 3.0
 
-                    agent_id = get_agent_id(agent_config)
-                    if not session_exists(agent_id):
+        try:
+            while True:
+                changed = False
+                sessions = list_agent_sessions()
+                for emp_id, agent_name, agent_id in watched:
+                    if not is_session_running(agent_id, sessions):
                         continue
 
                     output = capture_output(agent_id, args.lines)
                     if output is None:
                         continue
 
-                    agent_name = get_agent_name(emp_id)
                     output_key = f"{emp_id}_{agent_name}"
+                    # Keep only a digest per agent rather than the full captured pane.
+                    digest = hashlib.blake2s(output.encode('utf-8', 'replace'), digest_size=16).digest()
 
-                    if output_key not in last_outputs or output != last_outputs[output_key]:
+                    if last_outputs.get(output_key) != digest:
                         print(f"\n{'=' * 20} {emp_id} ({agent_name}) {'=' * 20}")
                         print(output)
-                        last_outputs[output_key] = output
+                        last_outputs[output_key] = digest
+                        changed = True
 
-                time.sleep(3)
+                if changed:
+                    interval = max(0.5, interval * 0.7)
+                else:
+                    interval = min(10.0, interval * 1.5)
+                time.sleep(interval)
         except KeyboardInterrupt:
             print("\n\n⏹  Monitoring stopped")
     else:
         print(f"📺 {team['name']} team output (last {args.lines} lines):")
         print("=" * 60)
 
-        for member in members:
-            emp_id = member.get('employee_id', 'unknown')
+        sessions = list_agent_sessions()
+
+        def probe(member):
+            emp_id, _role = member
             agent_name = get_agent_name(emp_id)
 
-            agent_config = resolve_agent(emp_id, agents_dir=_AGENTS_DIR)
+            agent_config = _resolve_agent_cached(emp_id)
             if not agent_config:
-                continue
+                return None
 
             agent_id = get_agent_id(agent_config)
-            is_running = session_exists(agent_id)
+            is_running = is_session_running(agent_id, sessions)
+            output = capture_output(agent_id, args.lines) if is_running else None
+            return emp_id, agent_name, is_running, output
+
+        for result in _map_members(probe, members):
+            if result is None:
+                continue
+            emp_id, agent_name, is_running, output = result
 
             print(f"\n{'─' * 20} {emp_id} ({agent_name}) ({'Running' if is_running else 'Stopped'}) {'─' * 20}")
 
             if is_running:
-                output = capture_output(agent_id, args.lines)
                 if output:
                     print(output)
                 else:
@@ -632,8 +997,12 @@ def cmd_create(args):
     """Create a new team configuration file."""
     teams_dir = get_teams_dir()
 
-    if not teams_dir.exists():
-        teams_dir.mkdir(parents=True, exist_ok=True)
+    # mkdir directly instead of exists() + mkdir; FileExistsError means it was there.
+    try:
+        teams_dir.mkdir(parents=True)
+    except FileExistsError:
+        pass
+    else:
         print(f"✅ Created teams directory: {teams_dir}")
 
     team_file = teams_dir / f"{args.name}.md"
@@ -647,7 +1016,7 @@ def cmd_create(args):
     # members are employee IDs
     members_yaml = "\n".join([f"      - employee_id: {m}\n        role: member" for m in args.members])
 
-    team_content = f"""---
+    parts = [f"""---
 name: {args.name}
 description: {args.description}
 lead_agent: {args.lead}
@@ -681,16 +1050,16 @@ graph TD
 
 ## Team Members
 
-"""
+"""]
 
     for member in args.members:
         agent_name = get_agent_name(member)
         role = "member"
         if member == args.lead:
             role = "team lead 👑"
-        team_content += f"- **{member}** ({agent_name}): {role}\n"
+        parts.append(f"- **{member}** ({agent_name}): {role}\n")
 
-    team_content += f"""
+    parts.append(f"""
 ## Usage
 
 Assign task to this team:
@@ -704,10 +1073,10 @@ Monitor team progress:
 ```bash
 python3 .agent/skills/team-manager/scripts/main.py monitor {args.name} --follow
 ```
-"""
+""")
 
     with open(team_file, 'w', encoding='utf-8') as f:
-        f.write(team_content)
+        f.write(''.join(parts))
 
     print(f"✅ Team created: {args.name}")
     print(f"   Configuration: {team_file}")
@@ -715,7 +1084,7 @@ python3 .agent/skills/team-manager/scripts/main.py monitor {args.name} --follow
     print(f"Next steps:")
     print(f"  1. Review and edit the workflow in {team_file}")
     print(f"  2. Ensure agents are configured in agents/")
-    print(f"  3. Assign a task: python3 {Path(__file__).resolve()} assign {args.name}")
+    print(f"  3. Assign a task: python3 {_SCRIPT_PATH} assign {args.name}")
 
     return 0
 
@@ -745,6 +1114,8 @@ Examples:
     list_parser = subparsers.add_parser('list', help='List all teams')
     list_parser.add_argument('--json', action='store_true',
                             help='Output in JSON format for programmatic consumption')
+    list_parser.add_argument('--resolve-names', action='store_true',
+                            help='With --json, also resolve lead_agent_name via agents/ (default: null)')
 
     # show command
     show_parser = subparsers.add_parser('show', help='Show team details')
@@ -768,6 +1139,8 @@ Examples:
     monitor_parser.add_argument('team', help='Team name')
     monitor_parser.add_argument('--follow', '-f', action='store_true',
                                help='Follow output (like tail -f)')
+    monitor_parser.add_argument('--stream', action='store_true',
+                               help='With --follow, stream new pane output via tmux pipe-pane instead of polling')
     monitor_parser.add_argument('--lines', '-n', type=int, default=50,
                                help='Number of lines per agent (default: 50)')
 
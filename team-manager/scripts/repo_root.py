@@ -9,17 +9,25 @@ Repo root resolution priority:
 2) git (superproject if in submodule, else toplevel)
 3) walk up from cwd looking for .agent/ and teams/
 4) fall back to cwd
+
+A plain checkout (a single .git directory up the tree) is resolved without
+running git. Other git-derived roots are cached per start directory for the
+life of the process.
 """
 
 from __future__ import annotations
 
+import functools
 import os
-import subprocess
+import stat
 from pathlib import Path
 from typing import Iterable, Optional
 
 
 def _run_git(cwd: Path, args: list[str]) -> Optional[str]:
+    # Imported lazily: plain checkouts and non-git trees never call git.
+    import subprocess
+
     try:
         result = subprocess.run(
             ["git", *args],
@@ -40,26 +48,87 @@ def _walk_parents(start_dir: Path) -> Iterable[Path]:
     yield from start_dir.parents
 
 
+def _has_agent_and_teams(directory: Path) -> bool:
+    # One directory read (d_type answers is_dir) instead of two stat() calls.
+    found = set()
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name in (".agent", "teams") and entry.is_dir():
+                    found.add(entry.name)
+                    if len(found) == 2:
+                        return True
+    except OSError:
+        pass
+    return False
+
+
+def _probe_git(start_dir: Path) -> tuple[str, Optional[Path]]:
+    """
+    Walk the ancestors once, lstat-ing each .git entry.
+
+    Returns:
+        ("none", None) when no .git entry exists anywhere up the tree (git can
+        only fail); ("plain", root) when the only one is a .git *directory*, so
+        root is what `git rev-parse --show-toplevel` would print and there is
+        no superproject; ("git", None) for everything else (gitfiles from
+        submodules/worktrees, nested checkouts, GIT_DIR/GIT_WORK_TREE).
+    """
+    # GIT_DIR lets git work without a .git entry, so defer to git then.
+    if os.environ.get("GIT_DIR"):
+        return "git", None
+
+    toplevel = None
+    for candidate in _walk_parents(start_dir):
+        try:
+            st = os.lstat(candidate / ".git")
+        except OSError:
+            continue
+        if toplevel is not None or not stat.S_ISDIR(st.st_mode):
+            # Nested checkout (possible submodule) or a gitfile: let git decide.
+            return "git", None
+        toplevel = candidate
+
+    if toplevel is None:
+        return "none", None
+    if os.environ.get("GIT_WORK_TREE"):
+        return "git", None
+    return "plain", toplevel
+
+
+def _git_repo_root(start_dir: Path) -> Optional[Path]:
+    # Outside any checkout git can only fail, and a plain checkout needs no git.
+    kind, root = _probe_git(start_dir)
+    if kind != "git":
+        return root
+
+    # One git call: the superproject line is printed first (only when inside a
+    # submodule), followed by the toplevel, so the first line is what we want.
+    output = _run_git(start_dir, ["rev-parse", "--show-superproject-working-tree", "--show-toplevel"])
+    lines = [line for line in (output or "").splitlines() if line.strip()]
+    return Path(lines[0]) if lines else None
+
+
+@functools.lru_cache(maxsize=8)
+def _find_repo_root_from(start_dir: Path) -> Path:
+    git_root = _git_repo_root(start_dir)
+    if git_root is not None:
+        return git_root
+
+    for candidate in _walk_parents(start_dir):
+        if _has_agent_and_teams(candidate):
+            return candidate
+
+    return start_dir
+
+
 def find_repo_root(start: Path) -> Path:
     repo_root_env = os.environ.get("REPO_ROOT")
     if repo_root_env:
         return Path(repo_root_env).expanduser()
 
     start_dir = start if start.is_dir() else start.parent
-
-    superproject = _run_git(start_dir, ["rev-parse", "--show-superproject-working-tree"])
-    if superproject:
-        return Path(superproject)
-
-    toplevel = _run_git(start_dir, ["rev-parse", "--show-toplevel"])
-    if toplevel:
-        return Path(toplevel)
-
-    for candidate in _walk_parents(start_dir):
-        if (candidate / ".agent").is_dir() and (candidate / "teams").is_dir():
-            return candidate
-
-    return start_dir
+    return _find_repo_root_from(start_dir)
 
 
 def get_repo_root() -> Path:
@@ -67,7 +136,12 @@ def get_repo_root() -> Path:
 
 
 def get_skill_search_dirs(repo_root: Optional[Path]) -> list[Path]:
-    home = Path.home()
+    return list(_skill_search_dirs(repo_root, Path.home()))
+
+
+@functools.lru_cache(maxsize=8)
+def _skill_search_dirs(repo_root: Optional[Path], home: Path) -> tuple[Path, ...]:
+    # Cached: built on every skill lookup, but only depends on repo root + $HOME.
     roots: list[Path] = []
 
     if repo_root is not None:
@@ -78,13 +152,13 @@ def get_skill_search_dirs(repo_root: Optional[Path]) -> list[Path]:
         roots.append(repo_root / ".claude" / "skills")
     roots.append(home / ".claude" / "skills")
 
-    return roots
+    return tuple(roots)
 
 
 def find_skill_dir(skill_name: str, repo_root: Optional[Path]) -> Optional[Path]:
     for root in get_skill_search_dirs(repo_root):
         candidate = root / skill_name
-        if candidate.exists() and candidate.is_dir():
+        if candidate.is_dir():
             return candidate
     return None
 
@@ -7,23 +7,43 @@ Team members are referenced by employee ID (e.g., EMP_0001).
 Workflow is defined in the markdown body using mermaid diagrams.
 """
 
+import copy
+import functools
 import re
 import os
+import stat
 import sys
 
-try:
-    import yaml  # type: ignore
-except Exception:  # pragma: no cover
-    yaml = None
-
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any, Tuple
+
+from repo_root import _find_repo_root_from, get_repo_root
+
+
+@functools.lru_cache(maxsize=None)
+def _load_yaml():
+    """
+    Import PyYAML on first use; simple frontmatter never needs it.
+
+    Returns:
+        (yaml module, loader class) preferring libyaml's CSafeLoader, or
+        (None, None) if PyYAML is not installed.
+    """
+    try:
+        import yaml  # type: ignore
+    except Exception:  # pragma: no cover
+        return None, None
+    return yaml, getattr(yaml, 'CSafeLoader', None) or yaml.SafeLoader
 
-from repo_root import get_repo_root
+
+# (cwd, teams_dir) from the last lookup that had to infer the repo root.
+_TEAMS_DIR_CACHE: Optional[Tuple[str, Path]] = None
 
 
 def get_teams_dir() -> Path:
     """Get the teams directory path."""
+    global _TEAMS_DIR_CACHE
+
     # Allow override via environment variable
     teams_dir = os.environ.get('TEAMS_DIR')
     if teams_dir:
@@ -35,11 +55,158 @@ def get_teams_dir() -> Path:
         return Path(repo_root) / 'teams'
 
     # If REPO_ROOT isn't set, infer it from the current working directory.
-    inferred = get_repo_root()
-    return inferred / 'teams'
+    cwd = os.getcwd()
+    if _TEAMS_DIR_CACHE is not None and _TEAMS_DIR_CACHE[0] == cwd:
+        return _TEAMS_DIR_CACHE[1]
 
+    result = get_repo_root() / 'teams'
+    _TEAMS_DIR_CACHE = (cwd, result)
+    return result
 
-def parse_team_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
+
+def _reset_caches() -> None:
+    """Forget cached teams, parsed files, teams-dir and repo-root lookups (for tests)."""
+    global _TEAMS_DIR_CACHE
+    _TEAMS_CACHE.clear()
+    _TEAMS_DIR_CACHE = None
+    _PARSE_CACHE.clear()
+    _find_repo_root_from.cache_clear()
+
+
+# Most team frontmatter is flat `key: value` pairs plus a `members:` list; parse
+# that subset directly and leave everything else (quotes, flow style, anchors,
+# comments, typed scalars) to PyYAML.
+_FM_KEY_RE = re.compile(r'^([A-Za-z_][A-Za-z0-9_-]*):(?:[ ]+(.*))?$')
+_FM_RESERVED = frozenset(
+    word
+    for base in ('yes', 'no', 'true', 'false', 'on', 'off', 'null')
+    for word in (base, base.capitalize(), base.upper())
+)
+_FM_BOOLS = {'true': True, 'false': False}
+_FM_UNSURE = object()
+
+
+def _fm_scalar(value: str) -> Any:
+    """Return VALUE as PyYAML would load it, or _FM_UNSURE if it might differ."""
+    value = value.strip()
+    if value in _FM_BOOLS:
+        return _FM_BOOLS[value]
+    if not value or value in _FM_RESERVED:
+        return _FM_UNSURE
+    first = value[0]
+    if not (first.isalpha() or first in '_$/('):
+        return _FM_UNSURE
+    if ':' in value or ' #' in value:
+        return _FM_UNSURE
+    return value
+
+
+def _fm_sequence(lines: List[str]) -> Optional[List[Any]]:
+    """Parse a block sequence of scalars or flat mappings; None if unsupported."""
+    lines = [line.rstrip() for line in lines if line.strip()]
+    indent = len(lines[0]) - len(lines[0].lstrip(' '))
+    item_prefix = ' ' * indent + '- '
+    items: List[Any] = []
+    current: Optional[Dict[str, Any]] = None
+    for line in lines:
+        depth = len(line) - len(line.lstrip(' '))
+        if depth == indent and line.startswith(item_prefix):
+            rest = line[indent + 2:]
+            if rest.startswith(' '):
+                return None
+            key_match = _FM_KEY_RE.match(rest)
+            if key_match:
+                current = {}
+                items.append(current)
+            else:
+                current = None
+                value = _fm_scalar(rest)
+                if value is _FM_UNSURE:
+                    return None
+                items.append(value)
+                continue
+        elif depth == indent + 2 and current is not None:
+            key_match = _FM_KEY_RE.match(line[depth:])
+            if not key_match:
+                return None
+        else:
+            return None
+
+        key, raw = key_match.group(1), key_match.group(2)
+        value = _fm_scalar(raw) if raw is not None else _FM_UNSURE
+        if key in _FM_RESERVED or key in current or value is _FM_UNSURE:
+            return None
+        current[key] = value
+    return items
+
+
+def _fast_parse_frontmatter(text: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse simple team frontmatter without PyYAML.
+
+    Returns:
+        The same dict yaml.safe_load would produce, or None when the text uses
+        anything beyond top-level scalars and block lists.
+    """
+    if '\t' in text or '\r' in text:
+        return None
+    lines = text.split('\n')
+    config: Dict[str, Any] = {}
+    i, count = 0, len(lines)
+    while i < count:
+        line = lines[i].rstrip()
+        i += 1
+        if not line:
+            continue
+        key_match = _FM_KEY_RE.match(line)
+        if not key_match:
+            return None
+        key, raw = key_match.group(1), key_match.group(2)
+        if key in _FM_RESERVED or key in config:
+            return None
+        if raw is not None and raw.strip():
+            value = _fm_scalar(raw)
+            if value is _FM_UNSURE:
+                return None
+            config[key] = value
+            continue
+
+        block = []
+        while i < count and (lines[i].startswith((' ', '-')) or not lines[i].strip()):
+            block.append(lines[i])
+            i += 1
+        if not any(item.strip() for item in block):
+            config[key] = None
+            continue
+        items = _fm_sequence(block)
+        if items is None:
+            return None
+        config[key] = items
+    return config
+
+
+# str(path) -> (st_mtime_ns, st_size, config) for files parsed so far.
+_PARSE_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _read_frontmatter_prefix(f, chunk_size: int = 8192) -> str:
+    """Read from F until the closing frontmatter marker (or EOF) has been seen."""
+    content = f.read(chunk_size)
+    if not content.startswith('---\n'):
+        return content
+    while content.find('\n---', 4) == -1:
+        chunk = f.read(chunk_size)
+        if not chunk:
+            break
+        content += chunk
+    return content
+
+
+def parse_team_frontmatter(
+    file_path: Path,
+    frontmatter_only: bool = False,
+    st: Optional[os.stat_result] = None,
+) -> Optional[Dict[str, Any]]:
     """
     Parse YAML frontmatter from a team configuration file.
 
@@ -66,41 +233,75 @@ def parse_team_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
       D --> E[QA approves]
       E --> F[Lead reports completion]
     ```
+
+    With frontmatter_only=True, reading stops after the closing marker and
+    'body' is left unset; get_team_body() loads it on demand. ST may be passed
+    when the caller already has the file's stat (e.g. from os.scandir).
     """
+    if st is None:
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error reading file {file_path}: {e}")
+            return None
+
+    cache_key = str(file_path)
+    cached = _PARSE_CACHE.get(cache_key)
+    if (
+        cached is not None
+        and cached[0] == st.st_mtime_ns
+        and cached[1] == st.st_size
+        and (frontmatter_only or 'body' in cached[2])
+    ):
+        return copy.copy(cached[2])
+
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+            if frontmatter_only:
+                content = _read_frontmatter_prefix(f)
+            else:
+                content = f.read()
     except FileNotFoundError:
         return None
     except Exception as e:
         print(f"Error reading file {file_path}: {e}")
         return None
 
-    # Extract YAML frontmatter between --- markers
-    pattern = r'^---\n(.*?)\n---'
-    match = re.match(pattern, content, re.DOTALL)
-
-    if not match:
-        return None
-
-    yaml_content = match.group(1)
-
-    if yaml is None:
+    # Extract YAML frontmatter between --- markers (plain substring search)
+    if not content.startswith('---\n'):
         return None
-
-    try:
-        config = yaml.safe_load(yaml_content) or {}
-    except Exception as e:
-        print(f"Error parsing YAML in {file_path}: {e}")
+    end = content.find('\n---', 4)
+    if end == -1:
         return None
 
-    # Extract markdown body (after frontmatter)
-    body_pattern = r'^---\n.*?\n---\n(.*)$'
-    body_match = re.match(body_pattern, content, re.DOTALL)
-    if body_match:
-        config['body'] = body_match.group(1).strip()
-    else:
-        config['body'] = ''
+    yaml_content = content[4:end]
+
+    config = _fast_parse_frontmatter(yaml_content)
+    if config is None:
+        yaml, loader = _load_yaml()
+        if yaml is None:
+            print(
+                f"Error: PyYAML is required to parse the frontmatter in {file_path}. "
+                "Install it with: pip install pyyaml",
+                file=sys.stderr,
+            )
+            return None
+
+        try:
+            config = yaml.load(yaml_content, Loader=loader) or {}
+        except Exception as e:
+            print(f"Error parsing YAML in {file_path}: {e}")
+            return None
+
+    # Markdown body: after the first "\n---\n" (normally the same closing marker)
+    if not frontmatter_only:
+        body_start = end if content.startswith('\n', end + 4) else content.find('\n---\n', end)
+        if body_start != -1:
+            config['body'] = content[body_start + 5:].strip()
+        else:
+            config['body'] = ''
 
     # Set defaults for optional fields
     config.setdefault('enabled', True)  # Teams are enabled by default
@@ -108,32 +309,99 @@ def parse_team_frontmatter(file_path: Path) -> Optional[Dict[str, Any]]:
     # Add metadata
     config['_file'] = file_path
     config['_file_name'] = file_path.stem
+    config['_file_name_lower'] = config['_file_name'].lower()
 
-    return config
+    _PARSE_CACHE[cache_key] = (st.st_mtime_ns, st.st_size, config)
+    return copy.copy(config)
 
 
-def list_all_teams() -> Dict[str, Dict[str, Any]]:
-    """List all configured teams from teams/ directory."""
-    if yaml is None:
-        print(
-            "Error: PyYAML is required to parse team config frontmatter. "
-            "Install it with: pip install pyyaml",
-            file=sys.stderr,
-        )
-        return {}
+# teams_dir -> (dir st_mtime_ns, ((path, st_mtime_ns, st_size), ...), teams,
+# teams by lowercased file name). Adding or removing a file bumps the dir mtime;
+# in-place edits are caught by re-statting the listed files.
+_TEAMS_CACHE: Dict[
+    Path,
+    Tuple[int, Tuple[Tuple[Path, int, int], ...], Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]],
+] = {}
+
+
+def _files_unchanged(signature: Tuple[Tuple[Path, int, int], ...]) -> bool:
+    for path, mtime_ns, size in signature:
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        if st.st_mtime_ns != mtime_ns or st.st_size != size:
+            return False
+    return True
+
 
+def _scan_team_files(teams_dir: Path) -> List[Tuple[Path, os.stat_result]]:
+    """
+    List teams/*.md in a single directory read (hidden files skipped, like glob).
+
+    Returns:
+        Sorted (path, stat) pairs; the stat comes from the scandir entry so
+        parse_team_frontmatter does not need its own.
+    """
+    files = []
+    try:
+        with os.scandir(teams_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.md') or entry.name.startswith('.'):
+                    continue
+                try:
+                    if entry.is_file():
+                        files.append((Path(entry.path), entry.stat()))
+                except FileNotFoundError:
+                    continue  # removed (or a dangling symlink) mid-scan
+    except OSError:
+        # Missing, not a directory, or unreadable: no teams (as glob would).
+        return []
+    return sorted(files, key=lambda item: item[0])
+
+
+def _load_teams() -> Tuple[Dict[str, Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """
+    Scan the teams directory (or reuse the cached scan).
+
+    Returns:
+        (teams by name, teams by lowercased file name).
+    """
     teams_dir = get_teams_dir()
 
-    if not teams_dir.exists():
-        return {}
+    try:
+        dir_st = os.stat(teams_dir)
+    except OSError:
+        return {}, {}
+    if not stat.S_ISDIR(dir_st.st_mode):
+        return {}, {}
+    dir_mtime = dir_st.st_mtime_ns
+    cached = _TEAMS_CACHE.get(teams_dir)
+    if cached is not None and cached[0] == dir_mtime and _files_unchanged(cached[1]):
+        return cached[2], cached[3]
+
+    team_files = _scan_team_files(teams_dir)
+    signature = tuple((path, st.st_mtime_ns, st.st_size) for path, st in team_files)
 
     teams = {}
-    for team_file in sorted(teams_dir.glob('*.md')):
-        config = parse_team_frontmatter(team_file)
+    for team_file, st in team_files:
+        # Unchanged files come straight from the per-file parse cache.
+        config = parse_team_frontmatter(team_file, frontmatter_only=True, st=st)
         if config and 'name' in config:
             teams[config['name']] = config
 
-    return teams
+    by_file_name: Dict[str, Dict[str, Any]] = {}
+    for config in teams.values():
+        by_file_name.setdefault(config['_file_name_lower'], config)
+
+    _TEAMS_CACHE[teams_dir] = (dir_mtime, signature, teams, by_file_name)
+    return teams, by_file_name
+
+
+def list_all_teams() -> Dict[str, Dict[str, Any]]:
+    """List all configured teams from teams/ directory."""
+    # A fresh dict per call, so callers can't alter the cached scan.
+    return dict(_load_teams()[0])
 
 
 def resolve_team(team_identifier: str) -> Optional[Dict[str, Any]]:
@@ -146,18 +414,26 @@ def resolve_team(team_identifier: str) -> Optional[Dict[str, Any]]:
     Returns:
         Team configuration dict or None if not found.
     """
-    all_teams = list_all_teams()
+    all_teams, by_file_name = _load_teams()
 
-    # Try exact name match
+    # Try exact name match, then file name match
     if team_identifier in all_teams:
         return all_teams[team_identifier]
+    return by_file_name.get(team_identifier.lower())
 
-    # Try file name match
-    for team_name, config in all_teams.items():
-        if config['_file_name'].lower() == team_identifier.lower():
-            return config
 
-    return None
+def _memoized(team_config: Dict[str, Any], key: str, compute: Callable[[], Any]) -> Any:
+    """
+    Cache a derived value on a parsed team config under a private key.
+
+    Only configs produced by parse_team_frontmatter (marked by '_file') are
+    cached; ad-hoc dicts are recomputed since callers may still mutate them.
+    """
+    if '_file' not in team_config:
+        return compute()
+    if key not in team_config:
+        team_config[key] = compute()
+    return team_config[key]
 
 
 def get_team_members(team_config: Dict[str, Any]) -> List[Dict[str, str]]:
@@ -167,6 +443,10 @@ def get_team_members(team_config: Dict[str, Any]) -> List[Dict[str, str]]:
     Returns:
         List of dicts with 'employee_id' and 'role' keys.
     """
+    return _memoized(team_config, '_members', lambda: _parse_members(team_config))
+
+
+def _parse_members(team_config: Dict[str, Any]) -> List[Dict[str, str]]:
     members = team_config.get('members', [])
 
     # Support both old format (agent) and new format (employee_id)
@@ -188,6 +468,19 @@ def get_team_members(team_config: Dict[str, Any]) -> List[Dict[str, str]]:
     return result
 
 
+def normalize_members(team_config: Dict[str, Any]) -> List[Tuple[str, str]]:
+    """
+    Get team members as plain (employee_id, role) tuples.
+
+    Missing fields default to 'unknown' / 'member', matching how the CLI
+    renders them.
+    """
+    return [
+        (m.get('employee_id', 'unknown'), m.get('role', 'member'))
+        for m in get_team_members(team_config)
+    ]
+
+
 def get_lead_agent_id(team_config: Dict[str, Any]) -> Optional[str]:
     """
     Get the lead agent's employee ID.
@@ -205,7 +498,12 @@ def get_team_body(team_config: Dict[str, Any]) -> str:
     Returns:
         Markdown content (including workflow diagrams).
     """
-    return team_config.get('body', '')
+    body = team_config.get('body')
+    if body is None and '_file' in team_config:
+        # Loaded by list_all_teams() without the body; read it now.
+        full = parse_team_frontmatter(team_config['_file'])
+        body = team_config['body'] = (full or {}).get('body', '')
+    return body or ''
 
 
 def get_team_working_directory(team_config: Dict[str, Any]) -> Optional[str]:
@@ -218,13 +516,21 @@ def get_team_working_directory(team_config: Dict[str, Any]) -> Optional[str]:
     Returns:
         Working directory path or None if not set.
     """
+    return _memoized(team_config, '_working_dir', lambda: _expand_working_directory(team_config))
+
+
+def _expand_working_directory(team_config: Dict[str, Any]) -> Optional[str]:
     wd = team_config.get('working_directory')
     if not wd:
         return None
 
-    # Expand environment variables like ${REPO_ROOT}
-    if isinstance(wd, str):
-        wd = os.path.expandvars(wd)
+    # Expand environment variables like ${REPO_ROOT}; literal paths skip the scan.
+    if isinstance(wd, str) and '$' in wd:
+        repo_root = os.environ.get('REPO_ROOT')
+        if repo_root is not None:
+            wd = wd.replace('${REPO_ROOT}', repo_root)
+        if '$' in wd:
+            wd = os.path.expandvars(wd)
 
     return wd
 
@@ -236,6 +542,10 @@ def validate_team_config(config: Dict[str, Any]) -> List[str]:
     Returns:
         List of error messages (empty if valid).
     """
+    return _memoized(config, '_validation_errors', lambda: _collect_validation_errors(config))
+
+
+def _collect_validation_errors(config: Dict[str, Any]) -> List[str]:
     errors = []
 
     required_fields = ['name', 'description', 'lead_agent']
@@ -249,7 +559,7 @@ def validate_team_config(config: Dict[str, Any]) -> List[str]:
 
     lead_agent = get_lead_agent_id(config)
     if lead_agent:
-        member_ids = [m.get('employee_id') for m in members]
+        member_ids = {m.get('employee_id') for m in members}
         if lead_agent not in member_ids:
             errors.append(f"Lead agent '{lead_agent}' not in members list")
 
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+
+
+class ProbeGitTests(unittest.TestCase):
+    def setUp(self):
+        import sys
+
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        from repo_root import _probe_git
+
+        self._probe_git = _probe_git
+        self._old_env = dict(os.environ)
+        os.environ.pop("GIT_DIR", None)
+        os.environ.pop("GIT_WORK_TREE", None)
+
+        self._tmp = tempfile.TemporaryDirectory(prefix="team-manager-skill-")
+        self.root = Path(self._tmp.name).resolve()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+        os.environ.clear()
+        os.environ.update(self._old_env)
+
+    def test_plain_repo(self):
+        (self.root / ".git").mkdir()
+        sub = self.root / "a" / "b"
+        sub.mkdir(parents=True)
+
+        self.assertEqual(self._probe_git(sub), ("plain", self.root))
+        self.assertEqual(self._probe_git(self.root), ("plain", self.root))
+
+    def test_nested_repo_defers_to_git(self):
+        (self.root / ".git").mkdir()
+        inner = self.root / "inner"
+        (inner / ".git").mkdir(parents=True)
+
+        self.assertEqual(self._probe_git(inner), ("git", None))
+
+    def test_gitfile_defers_to_git(self):
+        (self.root / ".git").write_text("gitdir: ../elsewhere/.git\n", encoding="utf-8")
+
+        self.assertEqual(self._probe_git(self.root), ("git", None))
+
+    def test_git_dir_env_defers_to_git(self):
+        (self.root / ".git").mkdir()
+        os.environ["GIT_DIR"] = str(self.root / ".git")
+
+        self.assertEqual(self._probe_git(self.root), ("git", None))
+
+    def test_no_git(self):
+        self.assertEqual(self._probe_git(self.root), ("none", None))
+
+
+if __name__ == "__main__":
+    unittest.main()
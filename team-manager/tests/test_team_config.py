@@ -10,17 +10,25 @@ SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
 
 class TeamConfigTests(unittest.TestCase):
     def setUp(self):
+        import sys
+
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        from team_config import _reset_caches
+
         self._old_env = dict(os.environ)
+        self._reset_caches = _reset_caches
+        _reset_caches()
 
     def tearDown(self):
         os.environ.clear()
         os.environ.update(self._old_env)
+        self._reset_caches()
 
     def test_list_and_resolve_team(self):
         import sys
 
         sys.path.insert(0, str(SCRIPTS_DIR))
-        from team_config import list_all_teams, resolve_team, validate_team_config
+        from team_config import get_team_body, list_all_teams, resolve_team, validate_team_config
 
         with tempfile.TemporaryDirectory(prefix="team-manager-skill-") as tmp_dir:
             teams_dir = Path(tmp_dir) / "teams"
@@ -63,6 +71,106 @@ class TeamConfigTests(unittest.TestCase):
             errors = validate_team_config(team)
             self.assertEqual(errors, [])
 
+            self.assertTrue(get_team_body(team).startswith("# Backend Team"))
+
+    def test_list_all_teams_follows_teams_dir(self):
+        import sys
+
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        from team_config import list_all_teams
+
+        with tempfile.TemporaryDirectory(prefix="team-manager-skill-") as tmp_dir:
+            for name in ("alpha", "beta"):
+                teams_dir = Path(tmp_dir) / name
+                teams_dir.mkdir()
+                (teams_dir / f"{name}.md").write_text(
+                    f"---\nname: {name}\ndescription: d\nlead_agent: EMP_0001\n---\n",
+                    encoding="utf-8",
+                )
+
+            os.environ["TEAMS_DIR"] = str(Path(tmp_dir) / "alpha")
+            self.assertEqual(list(list_all_teams()), ["alpha"])
+
+            os.environ["TEAMS_DIR"] = str(Path(tmp_dir) / "beta")
+            self.assertEqual(list(list_all_teams()), ["beta"])
+
+            beta_dir = Path(tmp_dir) / "beta"
+            (beta_dir / "gamma.md").write_text("---\nname: gamma\n---\n", encoding="utf-8")
+            os.utime(beta_dir, ns=(0, os.stat(beta_dir).st_mtime_ns + 1))
+            self.assertEqual(sorted(list_all_teams()), ["beta", "gamma"])
+
+            list_all_teams().pop("gamma")
+            self.assertEqual(sorted(list_all_teams()), ["beta", "gamma"])
+
+            os.environ["TEAMS_DIR"] = str(beta_dir / "gamma.md")
+            self.assertEqual(list_all_teams(), {})
+
+    def test_in_place_edit_is_seen(self):
+        import sys
+
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        from team_config import get_team_body, resolve_team
+
+        with tempfile.TemporaryDirectory(prefix="team-manager-skill-") as tmp_dir:
+            os.environ["TEAMS_DIR"] = tmp_dir
+            team_file = Path(tmp_dir) / "a.md"
+            team_file.write_text("---\nname: a\ndescription: old\n---\nold body\n", encoding="utf-8")
+
+            team = resolve_team("a")
+            self.assertEqual(team["description"], "old")
+            self.assertEqual(get_team_body(team), "old body")
+
+            with open(team_file, "w", encoding="utf-8") as f:
+                f.write("---\nname: a\ndescription: new\n---\nnew body, longer\n")
+            os.utime(team_file, ns=(0, os.stat(team_file).st_mtime_ns + 1))
+
+            team = resolve_team("a")
+            self.assertEqual(team["description"], "new")
+            self.assertEqual(get_team_body(team), "new body, longer")
+
+    def test_normalize_members(self):
+        import sys
+
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        from team_config import normalize_members
+
+        team = {
+            "members": [
+                {"employee_id": "EMP_0001", "role": "lead"},
+                {"agent": "EMP_0002"},
+                "EMP_0003",
+            ]
+        }
+        self.assertEqual(
+            normalize_members(team),
+            [("EMP_0001", "lead"), ("EMP_0002", "member"), ("EMP_0003", "member")],
+        )
+
+    def test_fast_parse_frontmatter_matches_yaml(self):
+        import sys
+
+        import yaml
+
+        sys.path.insert(0, str(SCRIPTS_DIR))
+        from team_config import _fast_parse_frontmatter
+
+        simple = textwrap.dedent(
+            """\
+            name: demo
+            description: Demo team (web)
+            enabled: false
+            working_directory: ${REPO_ROOT}/apps/web
+            members:
+              - employee_id: EMP_0001
+                role: lead
+              - EMP_0002
+            """
+        )
+        self.assertEqual(_fast_parse_frontmatter(simple), yaml.safe_load(simple))
+
+        for text in ("version: 1", "enabled: yes", "name: 'quoted'", "name: x # note", "lead:\n  id: x"):
+            self.assertIsNone(_fast_parse_frontmatter(text), text)
+
 
 if __name__ == "__main__":
     unittest.main()